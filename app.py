@@ -25,6 +25,125 @@ dash_app.title = "Judge and Charge Sentencing Dashboard"
 # Global variable to store data (lazy loading)
 _data_cache = None
 
+def read_cases(path='cases.csv'):
+    """
+    Read and clean criminal cases data, raising if the file is missing or empty
+    """
+    # Check if file exists
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"{path} file not found!")
+    
+    print(f"Found {path} file, attempting to load...")
+    
+    # Try to load the CSV file with proper data types to avoid warnings
+    dtype_dict = {
+        'AlcoholTestRefused': 'object',
+        'ComCntrl_Days': 'object',
+        'CommunityService': 'object'
+    }
+    
+    # Load with low_memory=False to avoid dtype warnings
+    df = pd.read_csv(path, dtype=dtype_dict, low_memory=False)
+    
+    print(f"Successfully loaded CSV with shape: {df.shape}")
+    print(f"Columns found: {list(df.columns)}")
+    
+    # Check if we have any data
+    if len(df) == 0:
+        raise pd.errors.EmptyDataError("CSV file is empty!")
+    
+    # Clean up any potential BOM characters from the CSV
+    df.columns = df.columns.str.replace('\ufeff', '')
+    
+    # Convert dates to datetime if columns exist
+    date_columns = ['FileDate', 'OffenseDate', 'DispositionDate']
+    for col in date_columns:
+        if col in df.columns:
+            try:
+                df[col] = pd.to_datetime(df[col], errors='coerce')
+                print(f"Successfully converted {col} to datetime")
+            except:
+                print(f"Warning: Could not convert {col} to datetime")
+    
+    # Clean up text fields by stripping whitespace
+    text_columns = ['Judge', 'Judge_First_Name', 'Judge_Last_Name', 'ChargeOffenseDescription', 
+                   'Statute', 'Statute_Description', 'DispositionDescription', 'Race_Tier_1', 
+                   'Gender', 'ConfinementType']
+    for col in text_columns:
+        if col in df.columns:
+            try:
+                df[col] = df[col].astype(str).str.strip()
+                # Replace 'nan' strings with actual NaN
+                df[col] = df[col].replace(['nan', 'NaN', ''], pd.NA)
+                print(f"Cleaned column: {col}")
+            except:
+                print(f"Warning: Could not clean column: {col}")
+    
+    # Process sentencing data - convert to numeric and handle nulls
+    # For jail time
+    if 'MaxCnfmnt_Days' in df.columns:
+        df['Jail_Days'] = pd.to_numeric(df['MaxCnfmnt_Days'], errors='coerce').fillna(0)
+    else:
+        df['Jail_Days'] = 0
+        
+    # For probation (handling all time units)
+    df['Probation_Days_Clean'] = 0
+    if 'Probation_Days' in df.columns:
+        days = pd.to_numeric(df['Probation_Days'], errors='coerce').fillna(0)
+        df['Probation_Days_Clean'] += days
+    if 'Probation_Mths' in df.columns:
+        months = pd.to_numeric(df['Probation_Mths'], errors='coerce').fillna(0) * 30
+        df['Probation_Days_Clean'] += months
+    if 'Probation_Yrs' in df.columns:
+        years = pd.to_numeric(df['Probation_Yrs'], errors='coerce').fillna(0) * 365
+        df['Probation_Days_Clean'] += years
+        
+    # For community control (handling all time units)
+    df['CommunityControl_Days'] = 0
+    if 'ComCntrl_Days' in df.columns:
+        days = pd.to_numeric(df['ComCntrl_Days'], errors='coerce').fillna(0)
+        df['CommunityControl_Days'] += days
+    if 'ComCntrl_Mths' in df.columns:
+        months = pd.to_numeric(df['ComCntrl_Mths'], errors='coerce').fillna(0) * 30
+        df['CommunityControl_Days'] += months
+    if 'ComCntrl_Yrs' in df.columns:
+        years = pd.to_numeric(df['ComCntrl_Yrs'], errors='coerce').fillna(0) * 365
+        df['CommunityControl_Days'] += years
+        
+    # For community service hours
+    if 'CommunityService' in df.columns:
+        df['CommunityService_Hours'] = pd.to_numeric(df['CommunityService'], errors='coerce').fillna(0)
+    else:
+        df['CommunityService_Hours'] = 0
+    
+    # Create a flag for cases with no sentence
+    df['Has_Sentence'] = (
+        (df['Jail_Days'] > 0) | 
+        (df['Probation_Days_Clean'] > 0) | 
+        (df['CommunityControl_Days'] > 0) | 
+        (df['CommunityService_Hours'] > 0)
+    )
+    
+    # Create full judge name if components exist
+    if all(col in df.columns for col in ['Judge_First_Name', 'Judge_Middle_Intial', 'Judge_Last_Name']):
+        # Handle missing values before concatenation
+        df['Judge_Full_Name'] = (
+            df['Judge_First_Name'].fillna('') + ' ' + 
+            df['Judge_Middle_Intial'].fillna('') + ' ' + 
+            df['Judge_Last_Name'].fillna('')
+        ).str.strip()
+    elif 'Judge' in df.columns:
+        df['Judge_Full_Name'] = df['Judge'].fillna('Unknown')
+    else:
+        df['Judge_Full_Name'] = 'Unknown'
+        
+    # Clean up judge names
+    df['Judge_Full_Name'] = df['Judge_Full_Name'].replace(['', 'nan', 'NaN', None], 'Unknown')
+    df.loc[df['Judge_Full_Name'].isna(), 'Judge_Full_Name'] = 'Unknown'
+    
+    print(f"Data loaded successfully with {len(df)} rows and {len(df.columns)} columns")
+    return df
+
 @lru_cache(maxsize=1)
 def load_data():
     """
@@ -37,125 +156,13 @@ def load_data():
         return _data_cache
     
     try:
-        # Check if file exists
-        if not os.path.exists('cases.csv'):
-            print("ERROR: cases.csv file not found!")
-            _data_cache = create_sample_data()
-            return _data_cache
-        
-        print("Found cases.csv file, attempting to load...")
-        
-        # Try to load the CSV file with proper data types to avoid warnings
-        dtype_dict = {
-            'AlcoholTestRefused': 'object',
-            'ComCntrl_Days': 'object',
-            'CommunityService': 'object'
-        }
-        
-        # Load with low_memory=False to avoid dtype warnings
-        df = pd.read_csv('cases.csv', dtype=dtype_dict, low_memory=False)
-        
-        print(f"Successfully loaded CSV with shape: {df.shape}")
-        print(f"Columns found: {list(df.columns)}")
-        
-        # Check if we have any data
-        if len(df) == 0:
-            print("ERROR: CSV file is empty!")
-            _data_cache = create_sample_data()
-            return _data_cache
-        
-        # Clean up any potential BOM characters from the CSV
-        df.columns = df.columns.str.replace('\ufeff', '')
-        
-        # Convert dates to datetime if columns exist
-        date_columns = ['FileDate', 'OffenseDate', 'DispositionDate']
-        for col in date_columns:
-            if col in df.columns:
-                try:
-                    df[col] = pd.to_datetime(df[col], errors='coerce')
-                    print(f"Successfully converted {col} to datetime")
-                except:
-                    print(f"Warning: Could not convert {col} to datetime")
-        
-        # Clean up text fields by stripping whitespace
-        text_columns = ['Judge', 'Judge_First_Name', 'Judge_Last_Name', 'ChargeOffenseDescription', 
-                       'Statute', 'Statute_Description', 'DispositionDescription', 'Race_Tier_1', 
-                       'Gender', 'ConfinementType']
-        for col in text_columns:
-            if col in df.columns:
-                try:
-                    df[col] = df[col].astype(str).str.strip()
-                    # Replace 'nan' strings with actual NaN
-                    df[col] = df[col].replace(['nan', 'NaN', ''], pd.NA)
-                    print(f"Cleaned column: {col}")
-                except:
-                    print(f"Warning: Could not clean column: {col}")
-        
-        # Process sentencing data - convert to numeric and handle nulls
-        # For jail time
-        if 'MaxCnfmnt_Days' in df.columns:
-            df['Jail_Days'] = pd.to_numeric(df['MaxCnfmnt_Days'], errors='coerce').fillna(0)
-        else:
-            df['Jail_Days'] = 0
-            
-        # For probation (handling all time units)
-        df['Probation_Days_Clean'] = 0
-        if 'Probation_Days' in df.columns:
-            days = pd.to_numeric(df['Probation_Days'], errors='coerce').fillna(0)
-            df['Probation_Days_Clean'] += days
-        if 'Probation_Mths' in df.columns:
-            months = pd.to_numeric(df['Probation_Mths'], errors='coerce').fillna(0) * 30
-            df['Probation_Days_Clean'] += months
-        if 'Probation_Yrs' in df.columns:
-            years = pd.to_numeric(df['Probation_Yrs'], errors='coerce').fillna(0) * 365
-            df['Probation_Days_Clean'] += years
-            
-        # For community control (handling all time units)
-        df['CommunityControl_Days'] = 0
-        if 'ComCntrl_Days' in df.columns:
-            days = pd.to_numeric(df['ComCntrl_Days'], errors='coerce').fillna(0)
-            df['CommunityControl_Days'] += days
-        if 'ComCntrl_Mths' in df.columns:
-            months = pd.to_numeric(df['ComCntrl_Mths'], errors='coerce').fillna(0) * 30
-            df['CommunityControl_Days'] += months
-        if 'ComCntrl_Yrs' in df.columns:
-            years = pd.to_numeric(df['ComCntrl_Yrs'], errors='coerce').fillna(0) * 365
-            df['CommunityControl_Days'] += years
-            
-        # For community service hours
-        if 'CommunityService' in df.columns:
-            df['CommunityService_Hours'] = pd.to_numeric(df['CommunityService'], errors='coerce').fillna(0)
-        else:
-            df['CommunityService_Hours'] = 0
-        
-        # Create a flag for cases with no sentence
-        df['Has_Sentence'] = (
-            (df['Jail_Days'] > 0) | 
-            (df['Probation_Days_Clean'] > 0) | 
-            (df['CommunityControl_Days'] > 0) | 
-            (df['CommunityService_Hours'] > 0)
-        )
-        
-        # Create full judge name if components exist
-        if all(col in df.columns for col in ['Judge_First_Name', 'Judge_Middle_Intial', 'Judge_Last_Name']):
-            # Handle missing values before concatenation
-            df['Judge_Full_Name'] = (
-                df['Judge_First_Name'].fillna('') + ' ' + 
-                df['Judge_Middle_Intial'].fillna('') + ' ' + 
-                df['Judge_Last_Name'].fillna('')
-            ).str.strip()
-        elif 'Judge' in df.columns:
-            df['Judge_Full_Name'] = df['Judge'].fillna('Unknown')
-        else:
-            df['Judge_Full_Name'] = 'Unknown'
-            
-        # Clean up judge names
-        df['Judge_Full_Name'] = df['Judge_Full_Name'].replace(['', 'nan', 'NaN', None], 'Unknown')
-        df.loc[df['Judge_Full_Name'].isna(), 'Judge_Full_Name'] = 'Unknown'
+        _data_cache = read_cases('cases.csv')
+        return _data_cache
         
-        print(f"Data loaded successfully with {len(df)} rows and {len(df.columns)} columns")
-        _data_cache = df
-        return df
+    except (FileNotFoundError, pd.errors.EmptyDataError) as e:
+        print(f"ERROR: {e}")
+        _data_cache = create_sample_data()
+        return _data_cache
         
     except Exception as e:
         print(f"ERROR loading data: {e}")
@@ -433,27 +440,15 @@ def initialize_dropdowns(_):
     
     return judge_options, charge_options, metrics
 
-# Main callback for updating all components
-@dash_app.callback(
-    [Output('summary-stats', 'children'),
-     Output('jail-distribution', 'figure'),
-     Output('probation-distribution', 'figure'),
-     Output('community-control-distribution', 'figure'),
-     Output('community-service-distribution', 'figure'),
-     Output('sentence-comparison', 'figure'),
-     Output('sentencing-table', 'data')],
-    [Input('judge-filter', 'value'),
-     Input('charge-filter', 'value'),
-     Input('sentence-filter', 'value')]
-)
-def update_dashboard(selected_judge, selected_charge, selected_sentence):
+# Columns shown in the detailed sentencing table and static reports
+TABLE_COLUMNS = ['Judge_Full_Name', 'ChargeOffenseDescription', 'Statute', 'Jail_Days', 
+                 'Probation_Days_Clean', 'CommunityControl_Days', 'CommunityService_Hours', 
+                 'Race_Tier_1', 'Has_Sentence']
+
+def filter_cases(df, selected_judge='all', selected_charge='all', selected_sentence='all'):
     """
-    Update all dashboard components based on filter selections
+    Apply the judge, charge and sentence filters used by the dashboard dropdowns
     """
-    # Load data (will use cache after first load)
-    df = load_data()
-    
-    # Filter data based on selections
     filtered_df = df.copy()
     
     # Apply judge filter
@@ -470,110 +465,103 @@ def update_dashboard(selected_judge, selected_charge, selected_sentence):
     elif selected_sentence == 'no_sentence':
         filtered_df = filtered_df[filtered_df['Has_Sentence'] == False]
     
-    # Create summary statistics
-    summary_stats = html.Div([
-        html.Div([
-            html.P(f"Cases in View: {len(filtered_df):,}", style={'margin': '5px'}),
-            html.P(f"Cases with Sentences: {len(filtered_df[filtered_df['Has_Sentence']==True]):,} ({len(filtered_df[filtered_df['Has_Sentence']==True])/len(filtered_df)*100:.1f}%)" if len(filtered_df) > 0 else "No data", 
-                   style={'margin': '5px'}),
-            html.P(f"Average Jail Time: {filtered_df[filtered_df['Jail_Days']>0]['Jail_Days'].mean():.1f} days" if len(filtered_df[filtered_df['Jail_Days']>0]) > 0 else "No jail sentences", 
-                   style={'margin': '5px'}),
-            html.P(f"Average Probation: {filtered_df[filtered_df['Probation_Days_Clean']>0]['Probation_Days_Clean'].mean():.1f} days" if len(filtered_df[filtered_df['Probation_Days_Clean']>0]) > 0 else "No probation sentences", 
-                   style={'margin': '5px'})
-        ], style={'textAlign': 'center'})
-    ])
-    
-    # Create jail time distribution
-    jail_fig = go.Figure()
+    return filtered_df
+
+def compute_summary_stats(filtered_df):
+    """
+    Compute the sentencing summary numbers for a filtered set of cases
+    """
+    sentenced = filtered_df[filtered_df['Has_Sentence'] == True]
     jail_data = filtered_df[filtered_df['Jail_Days'] > 0]['Jail_Days']
-    if len(jail_data) > 0:
-        jail_fig.add_trace(go.Histogram(
-            x=jail_data,
-            nbinsx=30,
-            name='Jail Days',
-            marker_color='#e74c3c'
+    probation_data = filtered_df[filtered_df['Probation_Days_Clean'] > 0]['Probation_Days_Clean']
+    
+    return {
+        'cases': len(filtered_df),
+        'cases_with_sentence': len(sentenced),
+        'pct_with_sentence': len(sentenced) / len(filtered_df) * 100 if len(filtered_df) > 0 else None,
+        'avg_jail_days': jail_data.mean() if len(jail_data) > 0 else None,
+        'avg_probation_days': probation_data.mean() if len(probation_data) > 0 else None
+    }
+
+def format_summary_lines(stats):
+    """
+    Format summary statistics as the text lines shown in the summary panel
+    """
+    return [
+        f"Cases in View: {stats['cases']:,}",
+        f"Cases with Sentences: {stats['cases_with_sentence']:,} ({stats['pct_with_sentence']:.1f}%)" if stats['cases'] > 0 else "No data",
+        f"Average Jail Time: {stats['avg_jail_days']:.1f} days" if stats['avg_jail_days'] is not None else "No jail sentences",
+        f"Average Probation: {stats['avg_probation_days']:.1f} days" if stats['avg_probation_days'] is not None else "No probation sentences"
+    ]
+
+def build_distribution_figure(data, nbins, name, color, title, xaxis_title, empty_text):
+    """
+    Build a histogram of non-zero sentence values, or an annotated empty figure
+    """
+    fig = go.Figure()
+    if len(data) > 0:
+        fig.add_trace(go.Histogram(
+            x=data,
+            nbinsx=nbins,
+            name=name,
+            marker_color=color
         ))
-        jail_fig.update_layout(
-            title=f"Jail Time Distribution (n={len(jail_data):,})",
-            xaxis_title="Days in Jail",
+        fig.update_layout(
+            title=f"{title} (n={len(data):,})",
+            xaxis_title=xaxis_title,
             yaxis_title="Number of Cases",
             showlegend=False
         )
     else:
-        jail_fig.add_annotation(text="No jail sentences in filtered data", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
-        jail_fig.update_layout(title="Jail Time Distribution")
+        fig.add_annotation(text=empty_text, xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
+        fig.update_layout(title=title)
+    return fig
+
+def summarize_sentences_by(filtered_df, column):
+    """
+    Average each sentence type per value of a column, busiest values first
+    """
+    summary = filtered_df.groupby(column).agg({
+        'Jail_Days': 'mean',
+        'Probation_Days_Clean': 'mean',
+        'CommunityControl_Days': 'mean',
+        'CommunityService_Hours': 'mean',
+        'CaseNumber': 'count'
+    }).round(1).reset_index()
+    return summary.sort_values('CaseNumber', ascending=False)
+
+def build_sentence_figures(filtered_df, selected_judge='all', selected_charge='all'):
+    """
+    Build the four distribution charts and the comparison chart for filtered cases
+    """
+    # Create jail time distribution
+    jail_fig = build_distribution_figure(
+        filtered_df[filtered_df['Jail_Days'] > 0]['Jail_Days'],
+        30, 'Jail Days', '#e74c3c', "Jail Time Distribution", "Days in Jail",
+        "No jail sentences in filtered data")
     
     # Create probation distribution
-    probation_fig = go.Figure()
-    probation_data = filtered_df[filtered_df['Probation_Days_Clean'] > 0]['Probation_Days_Clean']
-    if len(probation_data) > 0:
-        probation_fig.add_trace(go.Histogram(
-            x=probation_data,
-            nbinsx=30,
-            name='Probation Days',
-            marker_color='#3498db'
-        ))
-        probation_fig.update_layout(
-            title=f"Probation Time Distribution (n={len(probation_data):,})",
-            xaxis_title="Days on Probation",
-            yaxis_title="Number of Cases",
-            showlegend=False
-        )
-    else:
-        probation_fig.add_annotation(text="No probation sentences in filtered data", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
-        probation_fig.update_layout(title="Probation Time Distribution")
+    probation_fig = build_distribution_figure(
+        filtered_df[filtered_df['Probation_Days_Clean'] > 0]['Probation_Days_Clean'],
+        30, 'Probation Days', '#3498db', "Probation Time Distribution", "Days on Probation",
+        "No probation sentences in filtered data")
     
     # Create community control distribution
-    cc_fig = go.Figure()
-    cc_data = filtered_df[filtered_df['CommunityControl_Days'] > 0]['CommunityControl_Days']
-    if len(cc_data) > 0:
-        cc_fig.add_trace(go.Histogram(
-            x=cc_data,
-            nbinsx=20,
-            name='Community Control Days',
-            marker_color='#27ae60'
-        ))
-        cc_fig.update_layout(
-            title=f"Community Control Distribution (n={len(cc_data):,})",
-            xaxis_title="Days on Community Control",
-            yaxis_title="Number of Cases",
-            showlegend=False
-        )
-    else:
-        cc_fig.add_annotation(text="No community control sentences in filtered data", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
-        cc_fig.update_layout(title="Community Control Distribution")
+    cc_fig = build_distribution_figure(
+        filtered_df[filtered_df['CommunityControl_Days'] > 0]['CommunityControl_Days'],
+        20, 'Community Control Days', '#27ae60', "Community Control Distribution", "Days on Community Control",
+        "No community control sentences in filtered data")
     
     # Create community service distribution
-    cs_fig = go.Figure()
-    cs_data = filtered_df[filtered_df['CommunityService_Hours'] > 0]['CommunityService_Hours']
-    if len(cs_data) > 0:
-        cs_fig.add_trace(go.Histogram(
-            x=cs_data,
-            nbinsx=20,
-            name='Community Service Hours',
-            marker_color='#9b59b6'
-        ))
-        cs_fig.update_layout(
-            title=f"Community Service Distribution (n={len(cs_data):,})",
-            xaxis_title="Community Service Hours",
-            yaxis_title="Number of Cases",
-            showlegend=False
-        )
-    else:
-        cs_fig.add_annotation(text="No community service sentences in filtered data", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
-        cs_fig.update_layout(title="Community Service Distribution")
+    cs_fig = build_distribution_figure(
+        filtered_df[filtered_df['CommunityService_Hours'] > 0]['CommunityService_Hours'],
+        20, 'Community Service Hours', '#9b59b6', "Community Service Distribution", "Community Service Hours",
+        "No community service sentences in filtered data")
     
     # Create comparison chart
     if selected_judge and selected_judge != 'all' and len(filtered_df) > 0:
         # Show charge breakdown for selected judge
-        charge_summary = filtered_df.groupby('ChargeOffenseDescription').agg({
-            'Jail_Days': 'mean',
-            'Probation_Days_Clean': 'mean',
-            'CommunityControl_Days': 'mean',
-            'CommunityService_Hours': 'mean',
-            'CaseNumber': 'count'
-        }).round(1).reset_index()
-        charge_summary = charge_summary.sort_values('CaseNumber', ascending=False).head(15)
+        charge_summary = summarize_sentences_by(filtered_df, 'ChargeOffenseDescription').head(15)
         
         comparison_fig = go.Figure()
         comparison_fig.add_trace(go.Bar(name='Jail Days', x=charge_summary['ChargeOffenseDescription'], y=charge_summary['Jail_Days'], marker_color='#e74c3c'))
@@ -590,14 +578,7 @@ def update_dashboard(selected_judge, selected_charge, selected_sentence):
         )
     elif selected_charge and selected_charge != 'all' and len(filtered_df) > 0:
         # Show judge breakdown for selected charge
-        judge_summary = filtered_df.groupby('Judge_Full_Name').agg({
-            'Jail_Days': 'mean',
-            'Probation_Days_Clean': 'mean',
-            'CommunityControl_Days': 'mean',
-            'CommunityService_Hours': 'mean',
-            'CaseNumber': 'count'
-        }).round(1).reset_index()
-        judge_summary = judge_summary.sort_values('CaseNumber', ascending=False).head(15)
+        judge_summary = summarize_sentences_by(filtered_df, 'Judge_Full_Name').head(15)
         
         comparison_fig = go.Figure()
         comparison_fig.add_trace(go.Bar(name='Jail Days', x=judge_summary['Judge_Full_Name'], y=judge_summary['Jail_Days'], marker_color='#e74c3c'))
@@ -630,23 +611,61 @@ def update_dashboard(selected_judge, selected_charge, selected_sentence):
             comparison_fig.add_annotation(text="No data to display", xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
             comparison_fig.update_layout(title="Sentence Comparison")
     
-    # Prepare table data
-    table_columns = ['Judge_Full_Name', 'ChargeOffenseDescription', 'Statute', 'Jail_Days', 
-                    'Probation_Days_Clean', 'CommunityControl_Days', 'CommunityService_Hours', 
-                    'Race_Tier_1', 'Has_Sentence']
-    
-    available_columns = [col for col in table_columns if col in filtered_df.columns]
+    return jail_fig, probation_fig, cc_fig, cs_fig, comparison_fig
+
+def build_table_frame(filtered_df, limit=1000):
+    """
+    Select and round the detailed sentencing records shown in the table (all rows if limit is None)
+    """
+    available_columns = [col for col in TABLE_COLUMNS if col in filtered_df.columns]
     
     if available_columns and len(filtered_df) > 0:
-        # Limit to 1000 rows for performance
-        table_data = filtered_df[available_columns].head(1000).round({
+        # Limit to 1000 rows by default for dashboard performance
+        table_df = filtered_df[available_columns] if limit is None else filtered_df[available_columns].head(limit)
+        return table_df.round({
             'Jail_Days': 0, 
             'Probation_Days_Clean': 0, 
             'CommunityControl_Days': 0, 
             'CommunityService_Hours': 0
-        }).to_dict('records')
-    else:
-        table_data = []
+        })
+    return pd.DataFrame(columns=available_columns)
+
+# Main callback for updating all components
+@dash_app.callback(
+    [Output('summary-stats', 'children'),
+     Output('jail-distribution', 'figure'),
+     Output('probation-distribution', 'figure'),
+     Output('community-control-distribution', 'figure'),
+     Output('community-service-distribution', 'figure'),
+     Output('sentence-comparison', 'figure'),
+     Output('sentencing-table', 'data')],
+    [Input('judge-filter', 'value'),
+     Input('charge-filter', 'value'),
+     Input('sentence-filter', 'value')]
+)
+def update_dashboard(selected_judge, selected_charge, selected_sentence):
+    """
+    Update all dashboard components based on filter selections
+    """
+    # Load data (will use cache after first load)
+    df = load_data()
+    
+    # Filter data based on selections
+    filtered_df = filter_cases(df, selected_judge, selected_charge, selected_sentence)
+    
+    # Create summary statistics
+    summary_lines = format_summary_lines(compute_summary_stats(filtered_df))
+    summary_stats = html.Div([
+        html.Div([html.P(line, style={'margin': '5px'}) for line in summary_lines],
+                 style={'textAlign': 'center'})
+    ])
+    
+    # Create charts
+    jail_fig, probation_fig, cc_fig, cs_fig, comparison_fig = build_sentence_figures(
+        filtered_df, selected_judge, selected_charge)
+    
+    # Prepare table data
+    table_data = build_table_frame(filtered_df).to_dict('records')
     
     return (summary_stats, jail_fig, probation_fig, cc_fig, cs_fig, comparison_fig, table_data)
 
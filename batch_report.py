@@ -0,0 +1,160 @@
+"""
+Offline batch report generator for per-judge sentencing profiles
+Builds every judge's profile in one grouped pass using the dashboard's filtering and aggregation
+"""
+
+import argparse
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from html import escape
+
+import pandas as pd
+
+from app import (read_cases, filter_cases, compute_summary_stats, format_summary_lines,
+                 build_sentence_figures, build_table_frame, summarize_sentences_by)
+
+# Report page styling, kept close to the dashboard colours
+PAGE_STYLE = """
+body { font-family: Arial, sans-serif; background-color: #f8f9fa; color: #2c3e50; margin: 20px; }
+h1, h3 { text-align: center; }
+.summary { text-align: center; background-color: #ecf0f1; padding: 10px; margin-bottom: 20px; }
+.summary p { margin: 5px; }
+table { border-collapse: collapse; margin: 0 auto; font-size: 12px; }
+th { background-color: #3498db; color: white; padding: 8px; }
+td { padding: 6px 10px; border-bottom: 1px solid #ecf0f1; }
+"""
+
+def make_filenames(judges):
+    """
+    Map each judge name to a unique, filesystem-safe file stem
+    """
+    filenames = {}
+    used = set()
+    for judge in judges:
+        stem = re.sub(r'[^A-Za-z0-9]+', '_', judge).strip('_').lower() or 'unknown'
+        candidate = stem
+        suffix = 2
+        while candidate in used:
+            candidate = f"{stem}_{suffix}"
+            suffix += 1
+        used.add(candidate)
+        filenames[judge] = candidate
+    return filenames
+
+def render_html_page(title, body):
+    """
+    Wrap report content in a standalone HTML page
+    """
+    return (f"<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n"
+            f"<title>{escape(title)}</title>\n<style>{PAGE_STYLE}</style>\n</head>\n"
+            f"<body>\n{body}\n</body>\n</html>\n")
+
+def write_judge_report(judge, judge_df, output_dir, filename, output_format, selected_charge):
+    """
+    Write one judge's profile and return its summary statistics for the index
+    """
+    stats = compute_summary_stats(judge_df)
+
+    if output_format == 'parquet':
+        # Per-charge sentencing averages make up the judge's profile
+        summarize_sentences_by(judge_df, 'ChargeOffenseDescription').to_parquet(
+            os.path.join(output_dir, f"{filename}.parquet"), index=False)
+    else:
+        figures = build_sentence_figures(judge_df, judge, selected_charge)
+        # Only the first chart pulls in plotly.js, the rest reuse it
+        charts = ''.join(
+            fig.to_html(full_html=False, include_plotlyjs='cdn' if i == 0 else False)
+            for i, fig in enumerate(figures))
+        summary = ''.join(f"<p>{escape(line)}</p>" for line in format_summary_lines(stats))
+        # Static reports list every record rather than the dashboard's first 1000
+        table = build_table_frame(judge_df, limit=None).to_html(index=False, na_rep='')
+        body = (f"<p><a href=\"index.html\">&larr; All judges</a></p>\n"
+                f"<h1>Sentencing Profile: {escape(judge)}</h1>\n"
+                f"<h3>Sentencing Summary</h3>\n<div class=\"summary\">{summary}</div>\n"
+                f"{charts}\n<h3>Detailed Sentencing Records</h3>\n{table}")
+        with open(os.path.join(output_dir, f"{filename}.html"), 'w', encoding='utf-8') as f:
+            f.write(render_html_page(f"Sentencing Profile: {judge}", body))
+
+    return {'Judge_Full_Name': judge, 'Report': f"{filename}.{output_format}", **stats}
+
+def write_index(index_df, output_dir, output_format):
+    """
+    Write the index listing every judge report with its summary statistics
+    """
+    if output_format == 'parquet':
+        index_df.to_parquet(os.path.join(output_dir, 'index.parquet'), index=False)
+        return
+
+    rows = []
+    for record in index_df.to_dict('records'):
+        cells = [f"<a href=\"{escape(record['Report'])}\">{escape(record['Judge_Full_Name'])}</a>",
+                 f"{record['cases']:,}",
+                 f"{record['cases_with_sentence']:,}"]
+        for key in ['pct_with_sentence', 'avg_jail_days', 'avg_probation_days']:
+            cells.append(f"{record[key]:.1f}" if pd.notna(record[key]) else '')
+        rows.append('<tr>' + ''.join(f"<td>{cell}</td>" for cell in cells) + '</tr>')
+
+    headers = ['Judge', 'Cases', 'Cases with Sentences', '% with Sentence',
+               'Avg Jail Days', 'Avg Probation Days']
+    body = (f"<h1>Judge Sentencing Profiles</h1>\n<table>\n<tr>"
+            + ''.join(f"<th>{header}</th>" for header in headers)
+            + "</tr>\n" + '\n'.join(rows) + "\n</table>")
+    with open(os.path.join(output_dir, 'index.html'), 'w', encoding='utf-8') as f:
+        f.write(render_html_page("Judge Sentencing Profiles", body))
+
+def generate_reports(data_path, output_dir, output_format='html', selected_charge='all',
+                     selected_sentence='all', workers=None):
+    """
+    Generate a report for every judge plus an index, returning the index data
+    """
+    # Fail before any work starts rather than inside every worker
+    if output_format == 'parquet':
+        pd.io.parquet.get_engine('auto')
+
+    # Unlike the dashboard, never fall back to sample data for published reports
+    df = read_cases(data_path)
+
+    if selected_charge and selected_charge != 'all' and \
+            selected_charge not in set(df['ChargeOffenseDescription'].dropna()):
+        raise ValueError(f"Charge not found in {data_path}: {selected_charge}")
+
+    # Apply the non-judge filters once, then split by judge in a single grouped pass
+    filtered_df = filter_cases(df, 'all', selected_charge, selected_sentence)
+    if len(filtered_df) == 0:
+        raise ValueError("No cases match the selected filters")
+
+    os.makedirs(output_dir, exist_ok=True)
+    groups = list(filtered_df.groupby('Judge_Full_Name', sort=True))
+    filenames = make_filenames([judge for judge, _ in groups])
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(write_judge_report, judge, judge_df, output_dir,
+                                   filenames[judge], output_format, selected_charge)
+                   for judge, judge_df in groups]
+        index_df = pd.DataFrame([future.result() for future in futures])
+
+    write_index(index_df, output_dir, output_format)
+    print(f"Wrote {len(index_df)} judge reports to {output_dir}")
+    return index_df
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate per-judge sentencing profile reports")
+    parser.add_argument('--data', default='cases.csv', help="Path to the cases CSV file")
+    parser.add_argument('--output-dir', default='reports', help="Directory to write reports into")
+    parser.add_argument('--format', choices=['html', 'parquet'], default='html',
+                        help="Report format (parquet requires pyarrow or fastparquet)")
+    parser.add_argument('--charge', default='all', help="Restrict reports to a single charge description")
+    parser.add_argument('--sentence', choices=['all', 'with_sentence', 'no_sentence'], default='all',
+                        help="Sentence filter, as in the dashboard dropdown")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Number of worker processes (defaults to the CPU count)")
+    args = parser.parse_args()
+
+    try:
+        generate_reports(args.data, args.output_dir, args.format, args.charge, args.sentence, args.workers)
+    except (FileNotFoundError, ImportError, ValueError) as e:
+        parser.error(str(e))
+
+if __name__ == '__main__':
+    main()